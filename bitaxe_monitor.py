@@ -8,16 +8,29 @@
 
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 from datetime import datetime, timedelta
 import sys
-import math
 import os
 import re
 import gzip
-import glob
+import shutil
 import configparser
 import threading
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses the small stats payload ~10x faster and takes bytes directly,
+# skipping the UTF-8 decode; fall back to stdlib json when it's not installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
 # ANSI Colors
 COLOR_TIMESTAMP = "\033[92m"
@@ -31,13 +44,53 @@ COLOR_RESTARTS = "\033[96m"
 COLOR_COUNTDOWN = "\033[96m"
 COLOR_RESET = "\033[0m"
 
-ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
+# Status line templates built once at import; %-formatting into them each
+# tick is cheaper than re-assembling the whole colored f-string every
+# iteration. The plain twin feeds the logfile, so no per-line ANSI stripping.
+_LINE_TMPL = (f"{COLOR_TIMESTAMP}[%s]{COLOR_RESET} "
+              f"Host: {COLOR_HOSTNAME}%s{COLOR_RESET} | "
+              f"Uptime: {COLOR_UPTIME}%s{COLOR_RESET} | "
+              f"Hash: {COLOR_HASHRATE}%s GH/s{COLOR_RESET} | "
+              f"ASIC: {COLOR_ASIC_TEMP}%s°C{COLOR_RESET} | "
+              f"VR: {COLOR_VR_TEMP}%s°C{COLOR_RESET} | "
+              f"Shares: {COLOR_SHARES}%s{COLOR_RESET} | "
+              f"Restarts: {COLOR_RESTARTS}%d{COLOR_RESET}")
+
+_PLAIN_TMPL = ("[%s] Host: %s | Uptime: %s | Hash: %s GH/s | "
+               "ASIC: %s°C | VR: %s°C | Shares: %s | Restarts: %d")
+
+_stdout_isatty = sys.stdout.isatty()
+
+_today_cache = (None, "")
+
+def _today_str():
+    # Cached %Y-%m-%d; only re-formats when the local date actually rolls over
+    global _today_cache
+    day = time.localtime()[:3]
+    if day != _today_cache[0]:
+        _today_cache = (day, "%04d-%02d-%02d" % day)
+    return _today_cache[1]
+
+# Shared keep-alive session so repeated polls reuse the same TCP connection
+# instead of re-handshaking every interval. Safe to share across miner threads.
+# Transient failures are retried inside the request itself so one dropped
+# packet doesn't cost a whole missed interval.
+_retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504),
+               allowed_methods=frozenset(["GET", "POST"]))
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_retry))
+
+# Set on shutdown so sleeping monitor threads wake up immediately
+_stop = threading.Event()
 
 def countdown_timer(seconds):
-    next_check = datetime.now() + timedelta(seconds=seconds)
-    next_str = next_check.strftime("%d %b %Y %H:%M:%S")
-    print(f"{COLOR_COUNTDOWN}Next check in: {seconds} seconds ({next_str}){COLOR_RESET}", flush=True)
-    time.sleep(seconds)
+    # Routed through log_output so the countdown is gated on a TTY like every
+    # other line and serialized by the stdout lock; non-TTY runs stay silent.
+    if _stdout_isatty:
+        next_check = datetime.now() + timedelta(seconds=seconds)
+        next_str = next_check.strftime("%d %b %Y %H:%M:%S")
+        log_output(f"{COLOR_COUNTDOWN}Next check in: {seconds:.0f} seconds ({next_str}){COLOR_RESET}")
+    _stop.wait(seconds)
 
 def format_uptime(uptime_seconds):
     try:
@@ -50,7 +103,7 @@ def resolve_logfile(log_arg, ip, hostname=None):
     if not log_arg:
         return None
     log_arg = os.path.expanduser(log_arg)
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = _today_str()
 
     if os.path.isdir(log_arg) or log_arg.endswith('/'):
         os.makedirs(log_arg, exist_ok=True)
@@ -60,47 +113,170 @@ def resolve_logfile(log_arg, ip, hostname=None):
         os.makedirs(os.path.dirname(log_arg), exist_ok=True)
         return log_arg
 
-def log_output(line, logfile=None):
-    print(line)
-    if logfile:
-        plain_line = ansi_escape.sub('', line)
-        with open(logfile, "a") as f:
-            f.write(plain_line + "\n")
+class LogWriter:
+    # One buffered append-mode handle per logfile, shared across threads.
+    # Avoids the open/write/close syscall churn of appending line by line.
+    _writers = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._buf = bytearray()
+        self._last_flush = time.monotonic()
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    @classmethod
+    def get(cls, path):
+        with cls._registry_lock:
+            writer = cls._writers.get(path)
+            if writer is None:
+                writer = cls._writers[path] = cls(path)
+            return writer
+
+    def write(self, text):
+        with self._lock:
+            self._buf += text.encode("utf-8")
+            if len(self._buf) >= 4096 or time.monotonic() - self._last_flush >= 1.0:
+                self._drain()
+
+    def _drain(self):
+        if self._buf:
+            os.write(self._fd, self._buf)
+            self._buf.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            self._drain()
+
+    def reopen(self, new_path):
+        with self._lock:
+            self._drain()
+            os.close(self._fd)
+            self._fd = os.open(new_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            with LogWriter._registry_lock:
+                LogWriter._writers.pop(self.path, None)
+                LogWriter._writers[new_path] = self
+            self.path = new_path
+
+    @classmethod
+    def flush_all(cls):
+        with cls._registry_lock:
+            writers = list(cls._writers.values())
+        for writer in writers:
+            writer.flush()
+
+atexit.register(LogWriter.flush_all)
+
+_stdout_buf = sys.stdout.buffer
+_stdout_lock = threading.Lock()
+
+def log_output(line, plain=None, writer=None):
+    # Colored line for the terminal, pre-built plain twin for the logfile;
+    # skip the terminal write entirely when stdout isn't a TTY (daemon mode).
+    # Encoded bytes go straight to the stdout buffer, bypassing print()'s
+    # text-codec pass; the lock keeps threads from interleaving mid-line.
+    if _stdout_isatty:
+        with _stdout_lock:
+            _stdout_buf.write(line.encode("utf-8") + b"\n")
+            _stdout_buf.flush()
+    if writer:
+        writer.write((plain if plain is not None else line) + "\n")
+
+_yesterday_cache = (None, "")
+
+def _yesterday_str():
+    # Same rollover trick as _today_str: re-derive yesterday's %Y-%m-%d only
+    # when the local date changes instead of on every maintenance call.
+    global _yesterday_cache
+    day = time.localtime()[:3]
+    if day != _yesterday_cache[0]:
+        _yesterday_cache = (day, (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"))
+    return _yesterday_cache[1]
+
+# Compiled cleanup patterns keyed by hostname/IP; stable per monitor thread,
+# so there's no reason to re-escape and recompile on every cleanup pass.
+_cleanup_re_cache = {}
+
+def _cleanup_re(hostname_or_ip):
+    regex = _cleanup_re_cache.get(hostname_or_ip)
+    if regex is None:
+        regex = _cleanup_re_cache[hostname_or_ip] = re.compile(
+            rf"^{re.escape(hostname_or_ip)}-(\d{{4}})-(\d{{2}})-(\d{{2}})\.log(\.gz)?$")
+    return regex
 
 def compress_yesterdays_log(log_dir, hostname_or_ip):
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday = _yesterday_str()
     pattern = os.path.join(log_dir, f"{hostname_or_ip}-{yesterday}.log")
     if os.path.isfile(pattern):
         gz_path = pattern + ".gz"
         if not os.path.exists(gz_path):
+            # Copy in 1 MiB chunks at the C level; writelines iterated the
+            # source line by line in Python. Level 6 keeps the default ratio.
             with open(pattern, 'rb') as f_in:
-                with gzip.open(gz_path, 'wb') as f_out:
-                    f_out.writelines(f_in)
+                with gzip.open(gz_path, 'wb', compresslevel=6) as f_out:
+                    shutil.copyfileobj(f_in, f_out, 1 << 20)
             os.remove(pattern)
 
 def delete_old_logs(log_dir, hostname_or_ip, max_days):
-    cutoff = datetime.now() - timedelta(days=max_days)
-    for log_file in glob.glob(os.path.join(log_dir, f"{hostname_or_ip}-*.log*")):
-        basename = os.path.basename(log_file)
-        date_part = basename.split("-")[-1].split(".")[0]
+    # One scandir pass with a date regex beats glob (which stats every match)
+    # plus strptime: the YYYY-MM-DD names compare fine as integer tuples.
+    cutoff_dt = datetime.now() - timedelta(days=max_days)
+    cutoff = (cutoff_dt.year, cutoff_dt.month, cutoff_dt.day)
+    log_re = _cleanup_re(hostname_or_ip)
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            m = log_re.match(entry.name)
+            if m and (int(m[1]), int(m[2]), int(m[3])) < cutoff:
+                os.remove(entry.path)
+
+# Alerts are queued and posted by one background thread so a slow Discord
+# (or DNS stall) can never block a miner's polling loop for its 5 s timeout.
+_alert_q = queue.Queue()
+_alert_thread = None
+_alert_thread_lock = threading.Lock()
+
+def _alert_worker():
+    while True:
+        url, message = _alert_q.get()
+        batch = {url: [message]}
+        # Drain anything that arrived in the same tick and group per webhook,
+        # so a burst of alerts collapses into one POST each.
         try:
-            file_date = datetime.strptime(date_part, "%Y-%m-%d")
-            if file_date < cutoff:
-                os.remove(log_file)
-        except ValueError:
-            continue
+            while True:
+                url, message = _alert_q.get_nowait()
+                batch.setdefault(url, []).append(message)
+        except queue.Empty:
+            pass
+        for url, messages in batch.items():
+            try:
+                _session.post(url, json={"content": "\n".join(messages)}, timeout=5)
+            except Exception as e:
+                print(f"⚠️ Discord alert failed: {e}")
 
 def send_discord_alert(webhook_url, message):
-    try:
-        requests.post(webhook_url, json={"content": message}, timeout=5)
-    except Exception as e:
-        print(f"⚠️ Discord alert failed: {e}")
+    global _alert_thread
+    if _alert_thread is None:
+        with _alert_thread_lock:
+            if _alert_thread is None:
+                _alert_thread = threading.Thread(target=_alert_worker, daemon=True)
+                _alert_thread.start()
+    _alert_q.put((webhook_url, message))
+
+# Short-lived summary cache so back-to-back startup polls (e.g. on reload)
+# don't re-hit the same endpoint within the TTL.
+_summary_cache = {}
+_SUMMARY_TTL = 10
 
 def get_bitaxe_summary(ip):
+    entry = _summary_cache.get(ip)
+    if entry and time.monotonic() - entry[0] < _SUMMARY_TTL:
+        return entry[1]
     try:
-        response = requests.get(f"http://{ip}/api/system/info", timeout=5)
+        response = _session.get(f"http://{ip}/api/system/info", timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
 
         hostname = data.get("hostname", ip)
         hashrate = data.get("hashRate", 0)
@@ -110,7 +286,9 @@ def get_bitaxe_summary(ip):
         uptime = data.get("uptimeSeconds", 0)
         uptime_td = str(timedelta(seconds=int(uptime))) if uptime else "N/A"
 
-        return f"**{hostname}** (`{ip}`) — ⏱ {uptime_td}, 💪 {round(hashrate,1)} GH/s, 🔥 {asic_temp}°C ASIC / {vr_temp}°C VR, ✅ Shares: {shares}"
+        summary = f"**{hostname}** (`{ip}`) — ⏱ {uptime_td}, 💪 {round(hashrate,1)} GH/s, 🔥 {asic_temp}°C ASIC / {vr_temp}°C VR, ✅ Shares: {shares}"
+        _summary_cache[ip] = (time.monotonic(), summary)
+        return summary
     except Exception as e:
         return f"**{ip}** — ⚠️ Error fetching stats: `{e}`"
 
@@ -124,18 +302,44 @@ def monitor_bitaxe(ip: str, interval: int = 60, log_arg: str = None, max_days: i
     # Init log immediately
     logfile = resolve_logfile(log_arg, ip, host_for_logs) if log_arg else None
     log_dir = os.path.dirname(logfile) if logfile else None
+    writer = LogWriter.get(logfile) if logfile else None
+
+    # Maintenance key: the name actually embedded in the logfile basename.
+    # host_for_logs is reassigned to the device hostname after the first
+    # poll, but the files on disk keep this key, so compression and cleanup
+    # must keep matching on it.
+    log_key = host_for_logs
 
     if log_dir and os.path.isdir(log_dir):
-        compress_yesterdays_log(log_dir, host_for_logs)
+        compress_yesterdays_log(log_dir, log_key)
         if max_days:
-            delete_old_logs(log_dir, host_for_logs, max_days)
+            delete_old_logs(log_dir, log_key, max_days)
+
+    current_date = _today_str()
+    # First deadline comes from the += at the loop bottom; seeding it with
+    # +interval here as well made the very first wait last two intervals.
+    next_tick = time.monotonic()
 
     while True:
         wait_after_restart = False
+
+        # Midnight rollover: swing the writer to the new dated file and run
+        # maintenance for the day that just ended. The directory already
+        # exists, so no makedirs/resolve_logfile on this path.
+        today = _today_str()
+        if today != current_date:
+            if writer and logfile and current_date in logfile:
+                logfile = logfile.replace(current_date, today)
+                writer.reopen(logfile)
+                compress_yesterdays_log(log_dir, log_key)
+                if max_days:
+                    delete_old_logs(log_dir, log_key, max_days)
+            current_date = today
+
         try:
-            response = requests.get(stats_url, timeout=5)
+            response = _session.get(stats_url, timeout=5)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             hostname = data.get("hostname", "N/A")
             host_for_logs = hostname if hostname != "N/A" else host_for_logs
@@ -143,10 +347,13 @@ def monitor_bitaxe(ip: str, interval: int = 60, log_arg: str = None, max_days: i
             # Rename log with actual hostname if needed
             if log_arg and logfile and "unknown" in logfile:
                 logfile = resolve_logfile(log_arg, ip, host_for_logs)
+                log_key = host_for_logs
+                if writer:
+                    writer.reopen(logfile)
 
             hashrate = data.get("hashRate", "N/A")
             if isinstance(hashrate, (int, float)):
-                hashrate = math.ceil(hashrate * 10) / 10
+                hashrate = round(hashrate, 1)
             else:
                 hashrate = "N/A"
 
@@ -155,56 +362,208 @@ def monitor_bitaxe(ip: str, interval: int = 60, log_arg: str = None, max_days: i
                 asic_temp = round(asic_temp, 1)
 
             vr_temp = data.get("vrTemp", "N/A")
+            if isinstance(vr_temp, (int, float)):
+                vr_temp = round(vr_temp, 1)
             shares = data.get("sharesAccepted", 0)
             uptime_seconds = data.get("uptimeSeconds", None)
             uptime_str = format_uptime(uptime_seconds)
 
-            now = datetime.now().strftime("%d %b %Y %H:%M:%S")
-            output = (f"{COLOR_TIMESTAMP}[{now}]{COLOR_RESET} "
-                      f"Host: {COLOR_HOSTNAME}{hostname}{COLOR_RESET} | "
-                      f"Uptime: {COLOR_UPTIME}{uptime_str}{COLOR_RESET} | "
-                      f"Hash: {COLOR_HASHRATE}{hashrate} GH/s{COLOR_RESET} | "
-                      f"ASIC: {COLOR_ASIC_TEMP}{asic_temp}°C{COLOR_RESET} | "
-                      f"VR: {COLOR_VR_TEMP}{vr_temp}°C{COLOR_RESET} | "
-                      f"Shares: {COLOR_SHARES}{shares}{COLOR_RESET} | "
-                      f"Restarts: {COLOR_RESTARTS}{restart_count}{COLOR_RESET}")
-            log_output(output, logfile)
+            now = time.strftime("%d %b %Y %H:%M:%S")
+            fields = (now, hostname, uptime_str, hashrate,
+                      asic_temp, vr_temp, shares, restart_count)
+            log_output(_LINE_TMPL % fields, _PLAIN_TMPL % fields, writer)
 
             if prev_shares is not None:
                 if shares == prev_shares:
-                    log_output("❗ No new shares detected. Restarting Bitaxe...", logfile)
+                    log_output("❗ No new shares detected. Restarting Bitaxe...", writer=writer)
                     if discord_url:
                         send_discord_alert(discord_url, f"❗ Bitaxe at `{ip}` had no new shares. Restarting...")
                     try:
-                        restart_resp = requests.post(restart_url, timeout=5)
+                        restart_resp = _session.post(restart_url, timeout=5)
                         if restart_resp.status_code == 200:
                             restart_count += 1
-                            log_output("✅ Restart command sent successfully.", logfile)
+                            log_output("✅ Restart command sent successfully.", writer=writer)
                             if discord_url:
                                 send_discord_alert(discord_url, f"✅ Bitaxe at `{ip}` restarted successfully.")
                         else:
-                            log_output(f"⚠️ Failed to restart Bitaxe: {restart_resp.status_code}", logfile)
+                            log_output(f"⚠️ Failed to restart Bitaxe: {restart_resp.status_code}", writer=writer)
                             if discord_url:
                                 send_discord_alert(discord_url, f"⚠️ Bitaxe at `{ip}` failed to restart: {restart_resp.status_code}")
                     except requests.RequestException as e:
-                        log_output(f"🚫 Error sending restart command: {e}", logfile)
+                        log_output(f"🚫 Error sending restart command: {e}", writer=writer)
                         if discord_url:
                             send_discord_alert(discord_url, f"🚫 Error restarting Bitaxe at `{ip}`: {e}")
             else:
-                log_output("⏳ Initial share count received. Monitoring for changes...", logfile)
+                log_output("⏳ Initial share count received. Monitoring for changes...", writer=writer)
 
             prev_shares = shares
 
         except requests.RequestException as e:
-            log_output(f"🚫 Error communicating with Bitaxe at {ip}: {e}", logfile)
+            log_output(f"🚫 Error communicating with Bitaxe at {ip}: {e}", writer=writer)
             if discord_url:
                 send_discord_alert(discord_url, f"🚫 Could not communicate with Bitaxe at `{ip}`: {e}")
-            countdown_timer(10)
+            retry_in = min(interval, 5)
+            next_tick = time.monotonic() + retry_in
+            countdown_timer(retry_in)
             continue
 
-        countdown_timer(60 if wait_after_restart else interval)
+        # Deadline scheduling off the monotonic clock: sleeping for the
+        # remainder of the period, not the whole period, keeps the polls
+        # from drifting by the per-tick work time.
+        next_tick += 60 if wait_after_restart else interval
+        countdown_timer(max(0.0, next_tick - time.monotonic()))
+
+async def monitor_bitaxe_async(ip, interval, log_arg, max_days, discord_url, client):
+    # Async twin of monitor_bitaxe: all miners share one event loop and one
+    # httpx client, so 50 miners cost one OS thread instead of 50.
+    import asyncio
+    import httpx
+
+    async def alert(message):
+        try:
+            await client.post(discord_url, json={"content": message})
+        except Exception as e:
+            print(f"⚠️ Discord alert failed: {e}")
+
+    prev_shares = None
+    restart_count = 0
+    stats_url = f"http://{ip}/api/system/info"
+    restart_url = f"http://{ip}/api/system/restart"
+    host_for_logs = ip.replace('.', '_')
+
+    # Init log immediately
+    logfile = resolve_logfile(log_arg, ip, host_for_logs) if log_arg else None
+    log_dir = os.path.dirname(logfile) if logfile else None
+    writer = LogWriter.get(logfile) if logfile else None
 
-def run_from_config(config_file):
+    # Maintenance key: the name actually embedded in the logfile basename.
+    # host_for_logs is reassigned to the device hostname after the first
+    # poll, but the files on disk keep this key, so compression and cleanup
+    # must keep matching on it.
+    log_key = host_for_logs
+
+    if log_dir and os.path.isdir(log_dir):
+        compress_yesterdays_log(log_dir, log_key)
+        if max_days:
+            delete_old_logs(log_dir, log_key, max_days)
+
+    current_date = _today_str()
+    # First deadline comes from the += at the loop bottom; seeding it with
+    # +interval here as well made the very first wait last two intervals.
+    next_tick = time.monotonic()
+
+    while True:
+        wait_after_restart = False
+
+        # Midnight rollover: swing the writer to the new dated file and run
+        # maintenance for the day that just ended. The directory already
+        # exists, so no makedirs/resolve_logfile on this path.
+        today = _today_str()
+        if today != current_date:
+            if writer and logfile and current_date in logfile:
+                logfile = logfile.replace(current_date, today)
+                writer.reopen(logfile)
+                compress_yesterdays_log(log_dir, log_key)
+                if max_days:
+                    delete_old_logs(log_dir, log_key, max_days)
+            current_date = today
+
+        try:
+            response = await client.get(stats_url)
+            response.raise_for_status()
+            data = _loads(response.content)
+
+            hostname = data.get("hostname", "N/A")
+            host_for_logs = hostname if hostname != "N/A" else host_for_logs
+
+            # Rename log with actual hostname if needed
+            if log_arg and logfile and "unknown" in logfile:
+                logfile = resolve_logfile(log_arg, ip, host_for_logs)
+                log_key = host_for_logs
+                if writer:
+                    writer.reopen(logfile)
+
+            hashrate = data.get("hashRate", "N/A")
+            if isinstance(hashrate, (int, float)):
+                hashrate = round(hashrate, 1)
+            else:
+                hashrate = "N/A"
+
+            asic_temp = data.get("temp", "N/A")
+            if isinstance(asic_temp, (int, float)):
+                asic_temp = round(asic_temp, 1)
+
+            vr_temp = data.get("vrTemp", "N/A")
+            if isinstance(vr_temp, (int, float)):
+                vr_temp = round(vr_temp, 1)
+            shares = data.get("sharesAccepted", 0)
+            uptime_seconds = data.get("uptimeSeconds", None)
+            uptime_str = format_uptime(uptime_seconds)
+
+            now = time.strftime("%d %b %Y %H:%M:%S")
+            fields = (now, hostname, uptime_str, hashrate,
+                      asic_temp, vr_temp, shares, restart_count)
+            log_output(_LINE_TMPL % fields, _PLAIN_TMPL % fields, writer)
+
+            if prev_shares is not None:
+                if shares == prev_shares:
+                    log_output("❗ No new shares detected. Restarting Bitaxe...", writer=writer)
+                    if discord_url:
+                        await alert(f"❗ Bitaxe at `{ip}` had no new shares. Restarting...")
+                    try:
+                        restart_resp = await client.post(restart_url)
+                        if restart_resp.status_code == 200:
+                            restart_count += 1
+                            log_output("✅ Restart command sent successfully.", writer=writer)
+                            if discord_url:
+                                await alert(f"✅ Bitaxe at `{ip}` restarted successfully.")
+                        else:
+                            log_output(f"⚠️ Failed to restart Bitaxe: {restart_resp.status_code}", writer=writer)
+                            if discord_url:
+                                await alert(f"⚠️ Bitaxe at `{ip}` failed to restart: {restart_resp.status_code}")
+                    except httpx.HTTPError as e:
+                        log_output(f"🚫 Error sending restart command: {e}", writer=writer)
+                        if discord_url:
+                            await alert(f"🚫 Error restarting Bitaxe at `{ip}`: {e}")
+            else:
+                log_output("⏳ Initial share count received. Monitoring for changes...", writer=writer)
+
+            prev_shares = shares
+
+        except httpx.HTTPError as e:
+            log_output(f"🚫 Error communicating with Bitaxe at {ip}: {e}", writer=writer)
+            if discord_url:
+                await alert(f"🚫 Could not communicate with Bitaxe at `{ip}`: {e}")
+            retry_in = min(interval, 5)
+            next_tick = time.monotonic() + retry_in
+            await asyncio.sleep(retry_in)
+            continue
+
+        next_tick += 60 if wait_after_restart else interval
+        await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+def run_async(ips, interval, log_dir, max_days, discord):
+    import asyncio
+    try:
+        import httpx
+    except ImportError:
+        print("💥 Error: async mode requires the httpx package (pip install httpx).")
+        return
+
+    async def main():
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        async with httpx.AsyncClient(limits=limits, timeout=5) as client:
+            await asyncio.gather(*[
+                monitor_bitaxe_async(ip, interval, log_dir, max_days, discord, client)
+                for ip in ips
+            ])
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n🛑 Bitaxe monitoring stopped.")
+
+def run_from_config(config_file, use_async=False):
     config = configparser.ConfigParser()
     config.read(config_file)
 
@@ -214,31 +573,37 @@ def run_from_config(config_file):
     max_days = int(global_opts.get("max_days", 7))
     discord = global_opts.get("discord", None)
 
+    # One pass over the config; every later consumer works off this list.
+    miners = [ip for section in config.sections()
+              if section.startswith("bitaxe:") and (ip := config[section].get("ip"))]
+
+    # Fetch all startup summaries in parallel; the serial version stalled
+    # startup for up to 5 s per unreachable miner. map() keeps config order.
     summaries = []
-    for section in config.sections():
-        if section.startswith("bitaxe:"):
-            ip = config[section].get("ip")
-            if ip:
-                summaries.append(get_bitaxe_summary(ip))
+    if miners:
+        with ThreadPoolExecutor(max_workers=min(32, len(miners))) as executor:
+            summaries = list(executor.map(get_bitaxe_summary, miners))
 
     if discord:
         startup_msg = "**🔌 Bitaxe Flatline Monitor Started**\n\n" + "\n".join(summaries)
         send_discord_alert(discord, startup_msg)
 
-    for section in config.sections():
-        if section.startswith("bitaxe:"):
-            ip = config[section].get("ip")
-            if ip:
-                threading.Thread(
-                    target=monitor_bitaxe,
-                    args=(ip, interval, log_dir, max_days, discord),
-                    daemon=True
-                ).start()
+    if use_async:
+        run_async(miners, interval, log_dir, max_days, discord)
+        return
+
+    for ip in miners:
+        threading.Thread(
+            target=monitor_bitaxe,
+            args=(ip, interval, log_dir, max_days, discord),
+            daemon=True
+        ).start()
 
     try:
-        while True:
-            time.sleep(60)
+        while not _stop.is_set():
+            _stop.wait(60)
     except KeyboardInterrupt:
+        _stop.set()
         print("\n🛑 Bitaxe monitoring stopped.")
 
 if __name__ == "__main__":
@@ -249,10 +614,12 @@ if __name__ == "__main__":
     parser.add_argument("-m", "-max-days", type=int, help="Delete logs older than N days")
     parser.add_argument("-d", "-discord", metavar="URL", help="Discord webhook URL for alerts")
     parser.add_argument("-c", "-config", metavar="FILE", help="Path to config file")
+    parser.add_argument("-a", "-async", dest="use_async", action="store_true",
+                        help="Poll all miners on one asyncio event loop (requires httpx)")
     args = parser.parse_args()
 
     if args.c:
-        run_from_config(args.c)
+        run_from_config(args.c, use_async=args.use_async)
     elif args.ip:
         monitor_bitaxe(args.ip, args.i, args.l, args.m, args.d)
     else: